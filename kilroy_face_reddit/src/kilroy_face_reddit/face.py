@@ -1,14 +1,24 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, AsyncIterable, Dict, Optional, Set, Tuple, Type
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 from uuid import UUID
 
-from aiostream import stream
-from aiostream.aiter_utils import aiter, anext
 from asyncpraw import Reddit
 from asyncpraw.models import Subreddit, Submission
 from kilroy_face_server_py_sdk import (
@@ -27,7 +37,6 @@ from kilroy_server_py_utils import (
     CategorizableBasedOptionalParameter,
     Configurable,
 )
-from numpy import base_repr
 
 from kilroy_face_reddit.post import Post
 from kilroy_face_reddit.posters import Poster, BasicPoster
@@ -36,10 +45,26 @@ from kilroy_face_reddit.restrictions import Restriction
 from kilroy_face_reddit.scoring.modifiers import ScoreModifier
 from kilroy_face_reddit.scoring.raw import Scorer, RelativeScoreScorer
 from kilroy_face_reddit.scraping import Scraper, FrontpageScraper
+from kilroy_face_reddit.utils import (
+    aclose,
+    buffered,
+    to_base36,
+    transform,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _is_savable(cls: type) -> bool:
+    return issubclass(cls, Savable)
+
+
+@lru_cache(maxsize=None)
+def _is_configurable(cls: type) -> bool:
+    return issubclass(cls, Configurable)
+
+
 class Params(SerializableModel):
     client_id: str
     client_secret: str
@@ -76,10 +101,25 @@ class State:
     restrictions_params: Dict[str, Dict[str, Any]]
 
 
+@dataclass
+class ResolvedComponents:
+    processor_type: str
+    poster_type: str
+    posters_params: Dict[str, Dict[str, Any]]
+    scorer_type: str
+    scorers_params: Dict[str, Dict[str, Any]]
+    score_modifier_type: Optional[str]
+    score_modifiers_params: Dict[str, Dict[str, Any]]
+    scraper_type: str
+    scrapers_params: Dict[str, Dict[str, Any]]
+    restriction_type: Optional[str]
+    restrictions_params: Dict[str, Dict[str, Any]]
+
+
 class PosterParameter(CategorizableBasedParameter[State, Poster]):
     @classmethod
     async def _get_params(cls, state: State, category: str) -> Dict[str, Any]:
-        return {**state.posters_params.get(category, {})}
+        return state.posters_params.get(category, {})
 
     # noinspection PyMethodParameters
     @classproperty
@@ -90,7 +130,7 @@ class PosterParameter(CategorizableBasedParameter[State, Poster]):
 class ScorerParameter(CategorizableBasedParameter[State, Scorer]):
     @classmethod
     async def _get_params(cls, state: State, category: str) -> Dict[str, Any]:
-        return {**state.scorers_params.get(category, {})}
+        return state.scorers_params.get(category, {})
 
     # noinspection PyMethodParameters
     @classproperty
@@ -103,13 +143,13 @@ class ScoreModifierParameter(
 ):
     @classmethod
     async def _get_params(cls, state: State, category: str) -> Dict[str, Any]:
-        return {**state.score_modifiers_params.get(category, {})}
+        return state.score_modifiers_params.get(category, {})
 
 
 class ScraperParameter(CategorizableBasedParameter[State, Scraper]):
     @classmethod
     async def _get_params(cls, state: State, category: str) -> Dict[str, Any]:
-        return {**state.scrapers_params.get(category, {})}
+        return state.scrapers_params.get(category, {})
 
     # noinspection PyMethodParameters
     @classproperty
@@ -122,18 +162,58 @@ class RestrictionParameter(
 ):
     @classmethod
     async def _get_params(cls, state: State, category: str) -> Dict[str, Any]:
-        return {**state.restrictions_params.get(category, {})}
+        return state.restrictions_params.get(category, {})
 
 
 class RedditFaceBase(Face[State], ABC):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._params_cache: Optional[Params] = None
+        self._params_kwargs: Optional[Dict[str, Any]] = None
+        self._resetting = False
+        self._spare_client: Optional[Reddit] = None
+        self._client_key: Optional[Tuple[Any, ...]] = None
+        self._calls = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
     # noinspection PyMethodParameters
     @classproperty
     @abstractmethod
     def post_type(cls) -> str:
         pass
 
-    @staticmethod
-    async def _build_client(params: Params) -> Reddit:
+    def _start_call(self) -> None:
+        self._calls += 1
+        self._idle.clear()
+
+    def _finish_call(self) -> None:
+        self._calls -= 1
+        if self._calls == 0:
+            self._idle.set()
+
+    def _params(self) -> Params:
+        if self._params_kwargs is not self._kwargs:
+            self._params_cache = Params(**self._kwargs)
+            self._params_kwargs = self._kwargs
+        return self._params_cache
+
+    async def _build_client(self, params: Params) -> Reddit:
+        key = (
+            params.client_id,
+            params.client_secret,
+            params.refresh_token,
+            params.user_agent,
+            params.ratelimit_seconds,
+        )
+
+        client, self._spare_client = self._spare_client, None
+        if client is not None:
+            if key == self._client_key:
+                return client
+            await client.close()
+
+        self._client_key = key
         return Reddit(
             client_id=params.client_id,
             client_secret=params.client_secret,
@@ -142,6 +222,12 @@ class RedditFaceBase(Face[State], ABC):
             ratelimit_seconds=params.ratelimit_seconds,
         )
 
+    async def _release_client(self, client: Reddit) -> None:
+        if self._resetting:
+            self._spare_client = client
+        else:
+            await client.close()
+
     @staticmethod
     async def _build_subreddit(client: Reddit, params: Params) -> Subreddit:
         return await client.subreddit(params.subreddit)
@@ -199,53 +285,75 @@ class RedditFaceBase(Face[State], ABC):
         )
 
     async def _build_default_state(self) -> State:
-        params = Params(**self._kwargs)
+        params = self._params()
         client = await self._build_client(params)
 
+        try:
+            (
+                subreddit,
+                processor,
+                poster,
+                scorer,
+                score_modifier,
+                scraper,
+                restriction,
+            ) = await asyncio.gather(
+                self._build_subreddit(client, params),
+                self._build_processor(),
+                self._build_poster(params),
+                self._build_scorer(params),
+                self._build_score_modifier(params),
+                self._build_scraper(params),
+                self._build_restriction(params),
+            )
+        except BaseException:
+            await client.close()
+            raise
+
         return State(
             client=client,
-            subreddit=await self._build_subreddit(client, params),
-            processor=await self._build_processor(),
-            poster=await self._build_poster(params),
+            subreddit=subreddit,
+            processor=processor,
+            poster=poster,
             posters_params=params.posters_params,
-            scorer=await self._build_scorer(params),
+            scorer=scorer,
             scorers_params=params.scorers_params,
-            score_modifier=await self._build_score_modifier(params),
+            score_modifier=score_modifier,
             score_modifiers_params=params.score_modifiers_params,
-            scraper=await self._build_scraper(params),
+            scraper=scraper,
             scrapers_params=params.scrapers_params,
-            restriction=await self._build_restriction(params),
+            restriction=restriction,
             restrictions_params=params.restrictions_params,
         )
 
     @staticmethod
     async def _save_processor(state: State, directory: Path) -> None:
-        if isinstance(state.processor, Savable):
+        if _is_savable(type(state.processor)):
             await state.processor.save(directory / "processor")
 
     @staticmethod
     async def _save_poster(state: State, directory: Path) -> None:
-        if isinstance(state.poster, Savable):
+        if _is_savable(type(state.poster)):
             await state.poster.save(directory / "poster")
 
     @staticmethod
     async def _save_scorer(state: State, directory: Path) -> None:
-        if isinstance(state.scorer, Savable):
+        if _is_savable(type(state.scorer)):
             await state.scorer.save(directory / "scorer")
 
     @staticmethod
     async def _save_score_modifier(state: State, directory: Path) -> None:
-        if isinstance(state.score_modifier, Savable):
+        if _is_savable(type(state.score_modifier)):
             await state.score_modifier.save(directory / "score_modifier")
 
     @staticmethod
     async def _save_scraper(state: State, directory: Path) -> None:
-        if isinstance(state.scraper, Savable):
+        if _is_savable(type(state.scraper)):
             await state.scraper.save(directory / "scraper")
 
     @staticmethod
     async def _save_restriction(state: State, directory: Path) -> None:
-        if isinstance(state.restriction, Savable):
+        if _is_savable(type(state.restriction)):
             await state.restriction.save(directory / "restriction")
 
     @staticmethod
@@ -270,164 +378,216 @@ class RedditFaceBase(Face[State], ABC):
 
     @classmethod
     async def _save_state(cls, state: State, directory: Path) -> None:
-        await cls._save_processor(state, directory)
-        await cls._save_poster(state, directory)
-        await cls._save_scorer(state, directory)
-        await cls._save_score_modifier(state, directory)
-        await cls._save_scraper(state, directory)
-        await cls._save_restriction(state, directory)
+        await asyncio.gather(
+            cls._save_processor(state, directory),
+            cls._save_poster(state, directory),
+            cls._save_scorer(state, directory),
+            cls._save_score_modifier(state, directory),
+            cls._save_scraper(state, directory),
+            cls._save_restriction(state, directory),
+        )
         state_dict = await cls._create_state_dict(state)
         await cls._save_state_dict(state_dict, directory)
 
+    @classmethod
+    def _resolve_components(
+        cls, state_dict: Dict[str, Any], params: Params
+    ) -> ResolvedComponents:
+        return ResolvedComponents(
+            processor_type=state_dict.get("processor_type", cls.post_type),
+            poster_type=state_dict.get("poster_type", params.poster_type),
+            posters_params=state_dict.get(
+                "posters_params", params.posters_params
+            ),
+            scorer_type=state_dict.get("scorer_type", params.scorer_type),
+            scorers_params=state_dict.get(
+                "scorers_params", params.scorers_params
+            ),
+            score_modifier_type=state_dict.get(
+                "score_modifier_type", params.score_modifier_type
+            ),
+            score_modifiers_params=state_dict.get(
+                "score_modifiers_params", params.score_modifiers_params
+            ),
+            scraper_type=state_dict.get("scraper_type", params.scraper_type),
+            scrapers_params=state_dict.get(
+                "scrapers_params", params.scrapers_params
+            ),
+            restriction_type=state_dict.get(
+                "restriction_type", params.restriction_type
+            ),
+            restrictions_params=state_dict.get(
+                "restrictions_params", params.restrictions_params
+            ),
+        )
+
     @classmethod
     async def _load_processor(
-        cls, directory: Path, state_dict: Dict[str, Any]
+        cls, directory: Path, components: ResolvedComponents
     ) -> Processor:
-        category = state_dict.get("processor_type", cls.post_type)
         return await cls._load_generic(
             directory / "processor",
             Processor,
+            category=components.processor_type,
+            default=cls._build_processor,
+        )
+
+    @classmethod
+    async def _load_component(
+        cls,
+        directory: Path,
+        component_type: Type[Categorizable],
+        category: Optional[str],
+        components_params: Dict[str, Dict[str, Any]],
+        default: Callable[[], Awaitable[Optional[Categorizable]]],
+    ) -> Optional[Categorizable]:
+        if category is None:
+            return None
+
+        component_params = components_params.get(category) or {}
+        return await cls._load_generic(
+            directory,
+            component_type,
             category=category,
-            default=partial(cls._build_processor),
+            default=default,
+            **component_params,
         )
 
     @classmethod
     async def _load_poster(
-        cls, directory: Path, state_dict: Dict[str, Any], params: Params
+        cls, directory: Path, components: ResolvedComponents, params: Params
     ) -> Poster:
-        category = state_dict.get("poster_type", params.poster_type)
-        return await cls._load_generic(
+        return await cls._load_component(
             directory / "poster",
             Poster,
-            category=category,
-            **state_dict.get("posters_params", params.posters_params).get(
-                category, {}
-            ),
+            components.poster_type,
+            components.posters_params,
             default=partial(cls._build_poster, params),
         )
 
     @classmethod
     async def _load_scorer(
-        cls, directory: Path, state_dict: Dict[str, Any], params: Params
+        cls, directory: Path, components: ResolvedComponents, params: Params
     ) -> Scorer:
-        category = state_dict.get("scorer_type", params.scorer_type)
-        return await cls._load_generic(
+        return await cls._load_component(
             directory / "scorer",
             Scorer,
-            category=category,
-            **state_dict.get("scorers_params", params.scorers_params).get(
-                category, {}
-            ),
+            components.scorer_type,
+            components.scorers_params,
             default=partial(cls._build_scorer, params),
         )
 
     @classmethod
     async def _load_score_modifier(
-        cls, directory: Path, state_dict: Dict[str, Any], params: Params
+        cls, directory: Path, components: ResolvedComponents, params: Params
     ) -> Optional[ScoreModifier]:
-        if "score_modifier_type" in state_dict:
-            category = state_dict["score_modifier_type"]
-        else:
-            category = params.score_modifier_type
-
-        if category is None:
-            return None
-        return await cls._load_generic(
+        return await cls._load_component(
             directory / "score_modifier",
             ScoreModifier,
-            category=category,
-            **state_dict.get(
-                "score_modifiers_params", params.score_modifiers_params
-            ).get(category, {}),
+            components.score_modifier_type,
+            components.score_modifiers_params,
             default=partial(cls._build_score_modifier, params),
         )
 
     @classmethod
     async def _load_scraper(
-        cls, directory: Path, state_dict: Dict[str, Any], params: Params
+        cls, directory: Path, components: ResolvedComponents, params: Params
     ) -> Scraper:
-        category = state_dict.get("scraper_type", params.scraper_type)
-        return await cls._load_generic(
+        return await cls._load_component(
             directory / "scraper",
             Scraper,
-            category=category,
-            **state_dict.get("scrapers_params", params.scrapers_params).get(
-                category, {}
-            ),
+            components.scraper_type,
+            components.scrapers_params,
             default=partial(cls._build_scraper, params),
         )
 
     @classmethod
     async def _load_restriction(
-        cls, directory: Path, state_dict: Dict[str, Any], params: Params
+        cls, directory: Path, components: ResolvedComponents, params: Params
     ) -> Optional[Restriction]:
-        if "restriction_type" in state_dict:
-            category = state_dict["restriction_type"]
-        else:
-            category = params.restriction_type
-
-        if category is None:
-            return None
-        return await cls._load_generic(
+        return await cls._load_component(
             directory / "restriction",
             Restriction,
-            category=category,
-            **state_dict.get(
-                "restrictions_params", params.restrictions_params
-            ).get(category, {}),
+            components.restriction_type,
+            components.restrictions_params,
             default=partial(cls._build_restriction, params),
         )
 
     async def _load_saved_state(self, directory: Path) -> State:
         state_dict = await self._load_state_dict(directory)
-        params = Params(**self._kwargs)
+        params = self._params()
+        components = self._resolve_components(state_dict, params)
 
         client = await self._build_client(params)
 
+        try:
+            (
+                subreddit,
+                processor,
+                poster,
+                scorer,
+                score_modifier,
+                scraper,
+                restriction,
+            ) = await asyncio.gather(
+                self._build_subreddit(client, params),
+                self._load_processor(directory, components),
+                self._load_poster(directory, components, params),
+                self._load_scorer(directory, components, params),
+                self._load_score_modifier(directory, components, params),
+                self._load_scraper(directory, components, params),
+                self._load_restriction(directory, components, params),
+            )
+        except BaseException:
+            await client.close()
+            raise
+
         return State(
             client=client,
-            subreddit=await self._build_subreddit(client, params),
-            processor=await self._load_processor(directory, state_dict),
-            poster=await self._load_poster(directory, state_dict, params),
-            posters_params=state_dict.get(
-                "posters_params", params.posters_params
-            ),
-            scorer=await self._load_scorer(directory, state_dict, params),
-            scorers_params=state_dict.get(
-                "scorers_params", params.scorers_params
-            ),
-            score_modifier=await self._load_score_modifier(
-                directory, state_dict, params
-            ),
-            score_modifiers_params=state_dict.get(
-                "score_modifiers_params", params.score_modifiers_params
-            ),
-            scraper=await self._load_scraper(directory, state_dict, params),
-            scrapers_params=state_dict.get(
-                "scrapers_params", params.scrapers_params
-            ),
-            restriction=await self._load_restriction(
-                directory, state_dict, params
-            ),
-            restrictions_params=state_dict.get(
-                "restrictions_params", params.restrictions_params
-            ),
+            subreddit=subreddit,
+            processor=processor,
+            poster=poster,
+            posters_params=components.posters_params,
+            scorer=scorer,
+            scorers_params=components.scorers_params,
+            score_modifier=score_modifier,
+            score_modifiers_params=components.score_modifiers_params,
+            scraper=scraper,
+            scrapers_params=components.scrapers_params,
+            restriction=restriction,
+            restrictions_params=components.restrictions_params,
         )
 
+    def _cleanup_tasks(self, state: State) -> List[Awaitable[None]]:
+        tasks = []
+        if _is_configurable(type(state.processor)):
+            tasks.append(state.processor.cleanup())
+        if _is_configurable(type(state.poster)):
+            tasks.append(state.poster.cleanup())
+        if _is_configurable(type(state.scorer)):
+            tasks.append(state.scorer.cleanup())
+        if _is_configurable(type(state.score_modifier)):
+            tasks.append(state.score_modifier.cleanup())
+        if _is_configurable(type(state.scraper)):
+            tasks.append(state.scraper.cleanup())
+        if _is_configurable(type(state.restriction)):
+            tasks.append(state.restriction.cleanup())
+        return tasks
+
     async def cleanup(self) -> None:
         async with self.state.write_lock() as state:
-            if isinstance(state.processor, Configurable):
-                await state.processor.cleanup()
-            if isinstance(state.poster, Configurable):
-                await state.poster.cleanup()
-            if isinstance(state.scorer, Configurable):
-                await state.scorer.cleanup()
-            if isinstance(state.score_modifier, Configurable):
-                await state.score_modifier.cleanup()
-            if isinstance(state.scraper, Configurable):
-                await state.scraper.cleanup()
-            if isinstance(state.restriction, Configurable):
-                await state.restriction.cleanup()
+            await self._idle.wait()
+            await asyncio.gather(*self._cleanup_tasks(state))
+
+    async def reset_self(self) -> None:
+        self._resetting = True
+        try:
+            await super().reset_self()
+        finally:
+            self._resetting = False
+            client, self._spare_client = self._spare_client, None
+            if client is not None:
+                await client.close()
 
 
 class RedditFace(RedditFaceBase, Categorizable, ABC):
@@ -444,15 +604,25 @@ class RedditFace(RedditFaceBase, Categorizable, ABC):
             key="kilroy-face-reddit", description="Kilroy face for Reddit"
         )
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _post_type_cached(cls) -> str:
+        return cls.category
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _post_schema_cached(cls) -> JSONSchema:
+        return Processor.for_category(cls.post_type).post_schema
+
     # noinspection PyMethodParameters
     @classproperty
     def post_type(cls) -> str:
-        return cls.category
+        return cls._post_type_cached()
 
     # noinspection PyMethodParameters
     @classproperty
     def post_schema(cls) -> JSONSchema:
-        return Processor.for_category(cls.post_type).post_schema
+        return cls._post_schema_cached()
 
     # noinspection PyMethodParameters
     @classproperty
@@ -465,10 +635,11 @@ class RedditFace(RedditFaceBase, Categorizable, ABC):
             RestrictionParameter,
         }
 
-    async def cleanup(self) -> None:
-        await super().cleanup()
-        async with self.state.write_lock() as state:
-            await state.client.close()
+    def _cleanup_tasks(self, state: State) -> List[Awaitable[None]]:
+        return [
+            *super()._cleanup_tasks(state),
+            self._release_client(state.client),
+        ]
 
     async def post(
         self, content: Dict[str, Any]
@@ -476,12 +647,21 @@ class RedditFace(RedditFaceBase, Categorizable, ABC):
         logger.info("Creating new post...")
 
         async with self.state.read_lock() as state:
-            data = await state.processor.to_internal(content)
-            if state.restriction is not None:
-                if not await state.restriction.check(data):
+            processor = state.processor
+            restriction = state.restriction
+            poster = state.poster
+            subreddit = state.subreddit
+            self._start_call()
+
+        try:
+            data = await processor.to_internal(content)
+            if restriction is not None:
+                if not await restriction.check(data):
                     raise ValueError("Post is not allowed to be posted.")
 
-            post = await state.poster.post(state.subreddit, data)
+            post = await poster.post(subreddit, data)
+        finally:
+            self._finish_call()
 
         logger.info(f"New post id: {str(post.id)}.")
         return post.id, post.url
@@ -490,43 +670,83 @@ class RedditFace(RedditFaceBase, Categorizable, ABC):
         logger.info(f"Scoring post {str(id)}...")
 
         async with self.state.read_lock() as state:
-            submission = await state.client.submission(
-                id=base_repr(id.int, 36).lower()
-            )
-            score = await state.scorer.score(submission)
-            if state.score_modifier is not None:
-                score = await state.score_modifier.modify(submission, score)
+            client = state.client
+            scorer = state.scorer
+            score_modifier = state.score_modifier
+            self._start_call()
+
+        try:
+            submission = await client.submission(id=to_base36(id.int))
+            score = await scorer.score(submission)
+            if score_modifier is not None:
+                score = await score_modifier.modify(submission, score)
+        finally:
+            self._finish_call()
 
         logger.info(f"Score for post {str(id)}: {score}.")
         return score
 
-    async def _fetch(
-        self,
-        submissions: AsyncIterable[Submission],
-    ) -> AsyncIterable[Tuple[UUID, Dict[str, Any], float]]:
+    async def _process_one(
+        self, submission: Submission
+    ) -> Optional[Tuple[UUID, Dict[str, Any], float]]:
+        async with self.state.read_lock() as state:
+            scorer = state.scorer
+            score_modifier = state.score_modifier
+            processor = state.processor
+            self._start_call()
+
+        try:
+            score = await scorer.score(submission)
+            if score_modifier is not None:
+                score = await score_modifier.modify(submission, score)
+
+            try:
+                post = await Post.from_submission(submission)
+                data = await processor.to_external(post.data)
+            except Exception:
+                return None
+        finally:
+            self._finish_call()
+
+        return post.id, data, score
+
+    async def _read_locked(
+        self, submissions: AsyncIterable[Submission]
+    ) -> AsyncIterable[Submission]:
         submissions = aiter(submissions)
 
-        while True:
-            async with self.state.read_lock() as state:
-                try:
-                    submission = await anext(submissions)
-                except StopAsyncIteration:
-                    break
-
-                post_id = UUID(int=int(submission.id, 36))
-                score = await state.scorer.score(submission)
-                if state.score_modifier is not None:
-                    score = await state.score_modifier.modify(
-                        submission, score
-                    )
+        try:
+            while True:
+                async with self.state.read_lock():
+                    try:
+                        submission = await anext(submissions)
+                    except StopAsyncIteration:
+                        return
 
-                try:
-                    post = await Post.from_submission(submission)
-                    data = await state.processor.to_external(post.data)
-                except Exception:
-                    continue
+                yield submission
+        finally:
+            await aclose(submissions)
 
-                yield post_id, data, score
+    async def _fetch(
+        self,
+        submissions: AsyncIterable[Submission],
+        limit: Optional[int] = None,
+    ) -> AsyncIterable[Tuple[UUID, Dict[str, Any], float]]:
+        if limit is not None and limit <= 0:
+            return
+
+        # submissions are pulled under the read lock even though
+        # the buffer prefetches them in a separate task
+        size = 8 if limit is None else min(8, limit)
+        submissions = buffered(self._read_locked(submissions), size)
+        results = transform(self._process_one, submissions, 4, limit)
+
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+            await submissions.aclose()
 
     async def scrap(
         self,
@@ -537,18 +757,11 @@ class RedditFace(RedditFaceBase, Categorizable, ABC):
         async with self.state.read_lock() as state:
             submissions = state.scraper.scrap(state.client, before, after)
 
-        posts = self._fetch(submissions)
-        if limit is not None:
-            posts = stream.take(posts, limit)
-        else:
-            posts = stream.iterate(posts)
-
         logger.info("Scraping posts...")
 
-        async with posts.stream() as streamer:
-            async for post_id, post, score in streamer:
-                logger.info(f"Scraped post {str(post_id)}.")
-                yield post_id, post, score
+        async for post_id, post, score in self._fetch(submissions, limit):
+            logger.info(f"Scraped post {str(post_id)}.")
+            yield post_id, post, score
 
         logger.info("Scraping finished.")
 
@@ -1,8 +1,24 @@
+import asyncio
+from collections import deque
 from pathlib import Path
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Optional,
+    TypeVar,
+)
 from urllib.parse import urlparse
 
 import httpx
 
+T = TypeVar("T")
+U = TypeVar("U")
+
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
 
 async def download_image(url: str) -> bytes:
     async with httpx.AsyncClient() as client:
@@ -12,3 +28,106 @@ async def download_image(url: str) -> bytes:
 
 def get_filename_from_url(url: str) -> str:
     return Path(urlparse(url).path).name
+
+
+def to_base36(n: int) -> str:
+    if n == 0:
+        return "0"
+    digits = []
+    while n:
+        n, r = divmod(n, 36)
+        digits.append(_BASE36_DIGITS[r])
+    return "".join(reversed(digits))
+
+
+async def aclose(iterator: AsyncIterator) -> None:
+    close = getattr(iterator, "aclose", None)
+    if close is not None:
+        await close()
+
+
+async def buffered(
+    iterable: AsyncIterable[T], size: int = 8
+) -> AsyncIterator[T]:
+    iterator = aiter(iterable)
+    queue = asyncio.Queue()
+    slots = asyncio.Semaphore(size)
+
+    async def produce() -> None:
+        error = None
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    break
+                queue.put_nowait((True, item))
+        except Exception as e:
+            error = e
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            try:
+                await aclose(iterator)
+            finally:
+                queue.put_nowait((False, error))
+
+    task = asyncio.create_task(produce())
+
+    try:
+        while True:
+            ok, value = await queue.get()
+            if not ok:
+                if value is not None:
+                    raise value
+                return
+            slots.release()
+            yield value
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def transform(
+    func: Callable[[T], Awaitable[Optional[U]]],
+    iterable: AsyncIterable[T],
+    concurrency: int = 4,
+    limit: Optional[int] = None,
+) -> AsyncIterator[U]:
+    iterator = aiter(iterable)
+    pending: Deque[asyncio.Task] = deque()
+    exhausted = False
+    count = 0
+
+    try:
+        while limit is None or count < limit:
+            if limit is not None:
+                capacity = min(concurrency, limit - count)
+            else:
+                capacity = concurrency
+
+            while not exhausted and len(pending) < capacity:
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.append(asyncio.create_task(func(item)))
+
+            if not pending:
+                break
+
+            result = await pending[0]
+            pending.popleft()
+
+            if result is None:
+                continue
+
+            count += 1
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,143 @@
+import asyncio
+from uuid import UUID
+
+import pytest
+
+from kilroy_face_reddit.face import TextOnlyRedditFace
+from kilroy_face_reddit.scoring.raw import Scorer
+
+PARAMS = {
+    "client_id": "id",
+    "client_secret": "secret",
+    "refresh_token": "token",
+    "user_agent": "test",
+    "subreddit": "test",
+}
+
+
+class SlowScorer(Scorer):
+    events = []
+
+    async def score(self, post) -> float:
+        await asyncio.sleep(0.05)
+        self.events.append("score done")
+        return 1.0
+
+
+async def get_client(face):
+    async with face.state.read_lock() as state:
+        return state.client
+
+
+def record_close(client, events):
+    close = client.close
+
+    async def recorded_close():
+        events.append("client closed")
+        await close()
+
+    client.close = recorded_close
+
+
+def test_cleanup_waits_for_running_calls():
+    async def run():
+        events = SlowScorer.events = []
+        face = await TextOnlyRedditFace.create(**PARAMS, scorer_type="slow")
+        client = await get_client(face)
+
+        async def submission(id):
+            return id
+
+        client.submission = submission
+        record_close(client, events)
+
+        task = asyncio.create_task(face.score(UUID(int=1)))
+        await asyncio.sleep(0.01)
+        await face.cleanup()
+        await task
+        return events
+
+    assert asyncio.run(run()) == ["score done", "client closed"]
+
+
+def test_read_locked_pulls_under_read_lock():
+    async def run():
+        pulled = []
+
+        async def source():
+            for i in range(3):
+                pulled.append(i)
+                yield i
+
+        face = await TextOnlyRedditFace.create(**PARAMS)
+        iterator = face._read_locked(source())
+        first = await anext(iterator)
+
+        async with face.state.write_lock():
+            task = asyncio.create_task(anext(iterator))
+            await asyncio.sleep(0.01)
+            blocked = not task.done() and pulled == [0]
+
+        second = await task
+        await iterator.aclose()
+        await face.cleanup()
+        return first, blocked, second
+
+    assert asyncio.run(run()) == (0, True, 1)
+
+
+def test_reset_reuses_client():
+    async def run():
+        events = []
+        face = await TextOnlyRedditFace.create(**PARAMS)
+        client = await get_client(face)
+        record_close(client, events)
+
+        await face.reset_self()
+        reused = await get_client(face) is client
+        await face.cleanup()
+        return reused, events
+
+    assert asyncio.run(run()) == (True, ["client closed"])
+
+
+def test_reset_replaces_client_when_credentials_change():
+    async def run():
+        events = []
+        face = await TextOnlyRedditFace.create(**PARAMS)
+        client = await get_client(face)
+        record_close(client, events)
+
+        face._kwargs = {**PARAMS, "user_agent": "other"}
+        await face.reset_self()
+        replaced = await get_client(face) is not client
+        await face.cleanup()
+        return replaced, events
+
+    assert asyncio.run(run()) == (True, ["client closed"])
+
+
+def test_cleanup_closes_client():
+    async def run():
+        events = []
+        face = await TextOnlyRedditFace.create(**PARAMS)
+        record_close(await get_client(face), events)
+
+        await face.cleanup()
+        return events
+
+    assert asyncio.run(run()) == ["client closed"]
+
+
+def test_reset_closes_spare_client_when_init_fails():
+    async def run():
+        events = []
+        face = await TextOnlyRedditFace.create(**PARAMS)
+        record_close(await get_client(face), events)
+
+        face._kwargs = {**PARAMS, "ratelimit_seconds": "invalid"}
+        with pytest.raises(ValueError):
+            await face.reset_self()
+        return events, face._spare_client
+
+    assert asyncio.run(run()) == (["client closed"], None)
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from kilroy_face_reddit.utils import buffered, to_base36, transform
+
+
+async def numbers(n, closed=None):
+    try:
+        for i in range(n):
+            await asyncio.sleep(0)
+            yield i
+    finally:
+        if closed is not None:
+            closed.set()
+
+
+async def failing():
+    yield 0
+    raise RuntimeError("failed")
+
+
+async def double(x):
+    await asyncio.sleep((x % 3) / 1000)
+    return 2 * x
+
+
+async def double_odd(x):
+    return 2 * x if x % 2 else None
+
+
+async def fail_on_three(x):
+    if x == 3:
+        raise RuntimeError("failed")
+    return x
+
+
+def test_buffered_preserves_order():
+    async def run():
+        return [x async for x in buffered(numbers(20), 3)]
+
+    assert asyncio.run(run()) == list(range(20))
+
+
+def test_buffered_propagates_exceptions():
+    async def run():
+        return [x async for x in buffered(failing(), 3)]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_buffered_closes_source_on_early_close():
+    async def run():
+        closed = asyncio.Event()
+        iterator = buffered(numbers(100, closed), 3)
+        first = await anext(iterator)
+        await iterator.aclose()
+        return first, closed.is_set()
+
+    assert asyncio.run(run()) == (0, True)
+
+
+def test_buffered_does_not_hang_when_producer_is_cancelled():
+    async def run():
+        iterator = buffered(numbers(100), 3)
+        before = asyncio.all_tasks()
+        await anext(iterator)
+        for task in asyncio.all_tasks() - before:
+            task.cancel()
+
+        async def consume():
+            return [x async for x in iterator]
+
+        task = asyncio.create_task(consume())
+        done, _ = await asyncio.wait({task}, timeout=1)
+        task.cancel()
+        return task in done
+
+    assert asyncio.run(run())
+
+
+def test_transform_preserves_order():
+    async def run():
+        return [x async for x in transform(double, numbers(20), 4)]
+
+    assert asyncio.run(run()) == [2 * i for i in range(20)]
+
+
+def test_transform_drops_none_results():
+    async def run():
+        return [x async for x in transform(double_odd, numbers(10), 4)]
+
+    assert asyncio.run(run()) == [2, 6, 10, 14, 18]
+
+
+def test_transform_propagates_exceptions():
+    async def run():
+        return [x async for x in transform(fail_on_three, numbers(10), 4)]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_transform_does_not_process_past_limit():
+    async def run():
+        calls = []
+
+        async def record(x):
+            calls.append(x)
+            return x
+
+        results = [
+            x async for x in transform(record, buffered(numbers(20), 1), 4, 1)
+        ]
+        return results, calls
+
+    assert asyncio.run(run()) == ([0], [0])
+
+
+def test_transform_cancels_pending_on_early_close():
+    async def run():
+        started, cancelled = [], []
+
+        async def slow(x):
+            started.append(x)
+            try:
+                await asyncio.sleep(x)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return x
+
+        iterator = transform(slow, numbers(10), 4)
+        first = await anext(iterator)
+        await iterator.aclose()
+        others = asyncio.all_tasks() - {asyncio.current_task()}
+        return first, started[1:] == cancelled, others
+
+    assert asyncio.run(run()) == (0, True, set())
+
+
+@pytest.mark.parametrize(
+    "n", [0, 1, 35, 36, 1295, 1296, 2**64, 2**128 - 1]
+)
+def test_to_base36_round_trips(n):
+    encoded = to_base36(n)
+    assert encoded == encoded.lower()
+    assert int(encoded, 36) == n
+
+
+def test_to_base36_has_no_leading_zeros():
+    assert to_base36(0) == "0"
+    assert to_base36(36) == "10"
+    assert to_base36(2**128 - 1) == "f5lxx1zz5pnorynqglhzmsp33"